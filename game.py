@@ -1,6 +1,239 @@
 import numpy as np
-from typing import List, Tuple, Optional
-from copy import deepcopy
+import threading
+from collections import OrderedDict
+from typing import Iterator, List, Sequence, Tuple, Optional
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in decorator so the kernels below still import without numba"""
+        return lambda func: func
+
+
+# Only the 32 dark squares ((row + col) odd) are ever occupied, so they are numbered 0-31, four per row:
+# sq = (row * 8 + col) >> 1. Square sq is bit sq of each 32-bit bitboard
+NUM_SQUARES = 32
+FULL_MASK = (1 << NUM_SQUARES) - 1
+RANK_0 = 0xF                 # row 0 (white promotes here)
+RANK_7 = RANK_0 << 28        # row 7 (black promotes here)
+
+
+def sq_of(row: int, col: int) -> int:
+    """Returns the square number of the dark square (row, col)"""
+    return (row * 8 + col) >> 1
+
+
+def pos_of(sq: int) -> Tuple[int, int]:
+    """Returns the (row, col) of square sq"""
+    row = sq >> 2
+    return row, ((sq & 3) << 1) | (~row & 1)
+
+
+# Index of each square in a flattened 8x8 board, for unpacking to and from the numpy view
+BOARD_INDEX = np.array([row * 8 + col for row, col in map(pos_of, range(NUM_SQUARES))])
+
+# Diagonals as (row delta, col delta)
+DOWN_LEFT = (1, -1)
+DOWN_RIGHT = (1, 1)
+UP_LEFT = (-1, -1)
+UP_RIGHT = (-1, 1)
+
+KING_DIAGONALS = (DOWN_LEFT, DOWN_RIGHT, UP_LEFT, UP_RIGHT)
+# Diagonals each piece code may move along: empty, black man, black king, white man, white king
+DIAGONALS = ((), (DOWN_LEFT, DOWN_RIGHT), KING_DIAGONALS, (UP_LEFT, UP_RIGHT), KING_DIAGONALS)
+PLAYER_PIECES = {1: (1, 2), -1: (3, 4)}  # (man, king) piece codes of each player
+
+
+def _neighbour(sq: int, dr: int, dc: int, distance: int = 1) -> Optional[int]:
+    """Returns the square distance steps from sq along diagonal (dr, dc), or None if that is off the board"""
+    row, col = pos_of(sq)
+    row, col = row + distance * dr, col + distance * dc
+    return sq_of(row, col) if 0 <= row < 8 and 0 <= col < 8 else None
+
+
+def _step_rules(diagonals: tuple) -> Tuple[Tuple[int, int], ...]:
+    """Groups every step along diagonals by square offset, as ((offset, squares that step by it), ...).
+
+    A diagonal's offset depends on row parity (down-left is +4 from even rows, +3 from odd ones), so each offset
+    gets its own source mask; one bitboard shift then moves every piece that uses it."""
+    masks = {}
+    for sq in range(NUM_SQUARES):
+        for dr, dc in diagonals:
+            dst = _neighbour(sq, dr, dc)
+            if dst is not None:
+                masks[dst - sq] = masks.get(dst - sq, 0) | 1 << sq
+    return tuple(sorted(masks.items()))
+
+
+def _jump_rules(diagonals: tuple) -> Tuple[Tuple[int, int, int], ...]:
+    """Groups every jump along diagonals as ((landing offset, jumped offset, squares that jump by them), ...)"""
+    masks = {}
+    for sq in range(NUM_SQUARES):
+        for dr, dc in diagonals:
+            new_sq = _neighbour(sq, dr, dc, 2)
+            if new_sq is not None:
+                key = (new_sq - sq, _neighbour(sq, dr, dc) - sq)
+                masks[key] = masks.get(key, 0) | 1 << sq
+    return tuple((landing, jumped, mask) for (landing, jumped), mask in sorted(masks.items()))
+
+
+def _jump_table(diagonals: tuple) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+    """For every square, the (landing square, jumped square) of each jump along diagonals that stays on the board"""
+    return tuple(tuple((_neighbour(sq, dr, dc, 2), _neighbour(sq, dr, dc)) for dr, dc in diagonals
+                       if _neighbour(sq, dr, dc, 2) is not None)
+                 for sq in range(NUM_SQUARES))
+
+
+def _jump_array(table: tuple) -> np.ndarray:
+    """Packs a jump table into a (32, 4, 2) int64 array for the capture kernel, padding each square with -1"""
+    array = np.full((NUM_SQUARES, 4, 2), -1, dtype=np.int64)
+    for sq, jumps in enumerate(table):
+        if jumps:
+            array[sq, :len(jumps)] = jumps
+    return array
+
+
+# Precomputed at import so move generation never bounds-checks:
+# STEPS[piece] and JUMP_RULES[piece] drive the whole-bitboard shifts, JUMPS[piece][sq] -> ((landing_sq, jumped_sq), ...)
+STEPS = tuple(_step_rules(diagonals) for diagonals in DIAGONALS)
+JUMP_RULES = tuple(_jump_rules(diagonals) for diagonals in DIAGONALS)
+JUMPS = tuple(_jump_table(diagonals) for diagonals in DIAGONALS)
+JUMP_ARRAYS = tuple(_jump_array(table) for table in JUMPS)
+
+# Zobrist keys: ZOBRIST[piece][sq] for each piece code, with empty squares hashing to 0
+_rng = np.random.default_rng(0)
+ZOBRIST = _rng.integers(0, 2**64, size=(5, NUM_SQUARES), dtype=np.uint64).tolist()
+ZOBRIST[0] = [0] * NUM_SQUARES
+SIDE_KEY = int(_rng.integers(0, 2**64, dtype=np.uint64))  # Mixed in when white is to move
+# ZOBRIST_BYTES[piece][i][byte]: XOR of the keys of piece on the squares set in byte i of a bitboard
+ZOBRIST_BYTES = [[[0] * 256 for _ in range(NUM_SQUARES // 8)] for _ in ZOBRIST]
+for _piece, _keys in enumerate(ZOBRIST):
+    for _i, _table in enumerate(ZOBRIST_BYTES[_piece]):
+        for _byte in range(1, 256):
+            _low_bit = _byte & -_byte
+            _table[_byte] = _table[_byte ^ _low_bit] ^ _keys[8 * _i + _low_bit.bit_length() - 1]
+MOVE_CACHE_SIZE = 1 << 16  # Positions whose valid moves are remembered
+
+PROMOTION_RANK = {1: RANK_7, -1: RANK_0}  # Where each player's men are kinged
+
+# A move is (path, captured): path = (start_sq, sq_1, ..., sq_n) with one step or n jumps,
+# captured = bitboard of the jumped squares, so make_move never re-derives them
+Move = Tuple[Tuple[int, ...], int]
+
+
+def _jumped_square(sq: int, new_sq: int) -> int:
+    """Returns the square jumped over by a jump from sq to new_sq"""
+    # Midpoint rounds up on even rows, whose squares sit one column right of the odd rows' ones
+    return (sq + new_sq + (~sq >> 2 & 1)) >> 1
+
+
+def encode_move(start_pos: Tuple[int, int], moves: Sequence[Tuple[int, int]]) -> Move:
+    """Encodes a (start_pos, [positions]) move as (path, captured)"""
+    path = tuple(sq_of(row, col) for row, col in (start_pos, *moves))
+    captured = 0
+    for sq, new_sq in zip(path, path[1:]):
+        if abs(new_sq - sq) > 5:  # Jumps cover two rows (offset 7 or 9), steps one (3 to 5)
+            captured |= 1 << _jumped_square(sq, new_sq)
+    return path, captured
+
+
+def decode_move(move: Move) -> Tuple[Tuple[int, int], List[Tuple[int, int]]]:
+    """Decodes a move into (start_pos, [positions]) for display and user input"""
+    path, _ = move
+    return pos_of(path[0]), [pos_of(sq) for sq in path[1:]]
+
+
+def _zobrist_of(bitboard: int, piece: int) -> int:
+    """XOR of the Zobrist keys of piece on every square of the bitboard, one table lookup per byte"""
+    table = ZOBRIST_BYTES[piece]
+    return table[0][bitboard & 0xFF] ^ table[1][bitboard >> 8 & 0xFF] ^ table[2][bitboard >> 16 & 0xFF] ^ table[3][bitboard >> 24]
+
+
+def _shift(bitboard: int, offset: int) -> int:
+    """Shifts every square of the bitboard by offset (positive = towards row 7)"""
+    return bitboard << offset if offset > 0 else bitboard >> -offset
+
+
+def _squares(bitboard: int) -> Iterator[int]:
+    """Yields the index of every set bit, lowest first.
+
+    Called on a side's bitboard, this acts as its piece list: the cost is per piece, not per square."""
+    while bitboard:
+        low_bit = bitboard & -bitboard
+        yield low_bit.bit_length() - 1
+        bitboard ^= low_bit
+
+
+def _get_jumpers(pieces: int, jump_rules: tuple, opponents: int, empty: int) -> int:
+    """Returns the pieces that have at least one jump under jump_rules, testing every piece at once"""
+    jumpers = 0
+    for landing, jumped, mask in jump_rules:
+        # Bring the jumped and landing squares back onto each jumper's own bit
+        jumpers |= pieces & mask & _shift(opponents, -jumped) & _shift(empty, -landing)
+    return jumpers
+
+
+@njit(cache=True, boundscheck=False, nogil=True)
+def _capture_sequences_kernel(men: int, kings: int, opponents: int, empty: int,
+                              man_jumps: np.ndarray, king_jumps: np.ndarray) -> np.ndarray:
+    """Finds every maximal capture sequence of the given men and kings.
+
+    Depth-first search with an explicit stack instead of recursion. Landing squares already used on the
+    current branch are tracked in the `visited` bitmask. Returns the sequences flattened as
+    [length, captured, start_sq, sq_1, ..., sq_length, length, ...] where captured is the bitboard of jumped
+    squares, which is empty if no piece can capture."""
+    sequences = [np.int64(0) for _ in range(0)]
+    path = np.empty(33, dtype=np.int64)  # path[0] is the starting square, path[i] the i-th landing square
+    captured = np.empty(33, dtype=np.int64)  # captured[i] is the bitboard of squares jumped to reach path[i]
+    next_jump = np.empty(33, dtype=np.int64)
+    found_capture = np.empty(33, dtype=np.bool_)
+
+    for pieces, jumps in ((men, man_jumps), (kings, king_jumps)):
+        while pieces:
+            low_bit = pieces & -pieces
+            pieces ^= low_bit
+            start = np.int64(0)
+            while low_bit >> (start + 1):
+                start += 1
+
+            path[0] = start
+            captured[0] = 0
+            next_jump[0] = 0
+            found_capture[0] = False
+            depth = 0
+            visited = 0
+            while depth >= 0:
+                sq = path[depth]
+                jump = next_jump[depth]
+                if jump == 4 or jumps[sq, jump, 0] < 0:  # Every jump tried, backtrack
+                    if depth > 0:
+                        if not found_capture[depth]:
+                            sequences.append(depth)
+                            sequences.append(captured[depth])
+                            for i in range(depth + 1):
+                                sequences.append(path[i])
+                        visited &= ~(1 << sq)
+                    depth -= 1
+                    continue
+
+                next_jump[depth] = jump + 1
+                new_sq = jumps[sq, jump, 0]
+                if (not (visited >> new_sq) & 1 and
+                        (empty >> new_sq) & 1 and
+                        (opponents >> jumps[sq, jump, 1]) & 1):
+                    found_capture[depth] = True
+                    visited |= 1 << new_sq
+                    captured[depth + 1] = captured[depth] | 1 << jumps[sq, jump, 1]
+                    depth += 1
+                    path[depth] = new_sq
+                    next_jump[depth] = 0
+                    found_capture[depth] = False
+
+    return np.array(sequences, dtype=np.int64)
 
 
 class CheckersGame:
@@ -8,15 +241,23 @@ class CheckersGame:
     A class representing a game of Checkers.
 
     Attributes:
-        - board (np.ndarray): An 8x8 numpy array representing the board state.
+        - black_men, black_kings, white_men, white_kings (int): 32-bit bitboards over the dark squares, one per piece type.
         - current_player (int): The current player (1 for black, -1 for white).
+        - cells (np.ndarray): A uint8[32] array of the piece on each dark square, unpacked on demand. Assigning to it repacks the bitboards.
+        - board (np.ndarray): The same as an 8x8 uint8 array, with light squares always empty.
 
     Methods:
-        - get_valid_moves() -> List[Tuple[Tuple[int, int], List[Tuple[int, int]]]]: Returns a list of valid moves.
-        - make_move(start_pos: Tuple[int, int], moves: List[Tuple[int, int]]) -> None: Executes a move or a sequence of captures.
+        - get_valid_moves() -> List[Move]: Returns a list of valid moves, each encoded as (path, captured).
+        - make_move(move: Move) -> None: Executes a move or a sequence of captures.
         - is_game_over() -> bool: Determines if the game is over.
         - get_winner() -> Optional[int]: Returns the winner (-1 for white, 1 for black, None if game is ongoing).
-        - get_state() -> np.ndarray: Returns a deep copy of the board state.
+        - get_state() -> np.ndarray: Returns a copy of the board state.
+        - clone() -> CheckersGame: Returns an independent copy of the game, much cheaper than deepcopy.
+
+    Threading: a game must not be shared between threads, so give each worker its own clone(), e.g. one per root
+    move submitted to a concurrent.futures.ThreadPoolExecutor. The move cache is shared by all games and guarded by
+    a lock. The compiled capture kernel releases the GIL (nogil=True), so workers generating captures overlap;
+    the rest of move generation is Python bytecode and still takes turns on the GIL.
     """
 
     # Board representation:
@@ -26,14 +267,23 @@ class CheckersGame:
     # 3 = white piece
     # 4 = white king
 
-    board: np.ndarray
+    black_men: int
+    black_kings: int
+    white_men: int
+    white_kings: int
     current_player: int
 
+    # Valid moves keyed by the position's Zobrist key, shared by every game so search rollouts reuse each other's work
+    _move_cache: OrderedDict = OrderedDict()
+    _move_cache_lock = threading.Lock()
+
     def __init__(self):
-        self.board = np.zeros((8, 8), dtype=int)
+        self.black_men = self.black_kings = 0
+        self.white_men = self.white_kings = 0
         self.current_player = 1  # 1 for black, -1 for white
 
         self._initialize_board()
+        self._hash = self._compute_hash()
 
     def _initialize_board(self):
         """Initializes 8x8 board"""
@@ -42,145 +292,234 @@ class CheckersGame:
         for row in range(3):
             for col in range(8):
                 if (row + col) % 2 == 1:
-                    self.board[row][col] = 1
+                    self.black_men |= 1 << sq_of(row, col)
 
         # Set up white pieces (bottom of board)
         for row in range(5, 8):
             for col in range(8):
                 if (row + col) % 2 == 1:
-                    self.board[row][col] = 3
-
-    def get_valid_moves(self) -> List[Tuple[Tuple[int, int], List[Tuple[int, int]]]]:
-        """Returns list of valid moves in format (start_pos, [capture_positions])"""
+                    self.white_men |= 1 << sq_of(row, col)
+
+    @property
+    def cells(self) -> np.ndarray:
+        cells = np.zeros(NUM_SQUARES, dtype=np.uint8)
+        for piece, bitboard in ((1, self.black_men), (2, self.black_kings),
+                                (3, self.white_men), (4, self.white_kings)):
+            cells[list(_squares(bitboard))] = piece
+        return cells
+
+    @cells.setter
+    def cells(self, cells: np.ndarray) -> None:
+        cells = np.asarray(cells)
+        # One vectorized compare per piece code, packed little-endian so square sq lands on bit sq
+        self.black_men, self.black_kings, self.white_men, self.white_kings = (
+            int.from_bytes(np.packbits(cells == piece, bitorder='little').tobytes(), 'little')
+            for piece in (1, 2, 3, 4))
+        self._hash = self._compute_hash()
+
+    @property
+    def board(self) -> np.ndarray:
+        board = np.zeros(64, dtype=np.uint8)
+        board[BOARD_INDEX] = self.cells
+        return board.reshape(8, 8)
+
+    @board.setter
+    def board(self, board: np.ndarray) -> None:
+        self.cells = np.asarray(board).ravel()[BOARD_INDEX]
+
+    def _compute_hash(self) -> int:
+        """Zobrist hash of the pieces on the board, from scratch. make_move keeps it up to date incrementally"""
+        return (_zobrist_of(self.black_men, 1) ^ _zobrist_of(self.black_kings, 2) ^
+                _zobrist_of(self.white_men, 3) ^ _zobrist_of(self.white_kings, 4))
+
+    def get_valid_moves(self) -> List[Move]:
+        """Returns list of valid moves in format ((start_sq, sq_1, ..., sq_n), captured); see decode_move
+
+        Results are cached per position (LRU, MOVE_CACHE_SIZE entries), so asking again costs a lookup."""
+        key = self._cache_key()
+        cache = self._move_cache
+        with self._move_cache_lock:
+            moves = cache.get(key)
+            if moves is not None:
+                cache.move_to_end(key)
+        if moves is None:
+            moves = self._generate_moves()  # Outside the lock, so threads generating different positions overlap
+            with self._move_cache_lock:
+                cache[key] = moves
+                if len(cache) > MOVE_CACHE_SIZE:
+                    cache.popitem(last=False)
+        return list(moves)
+
+    def _cache_key(self) -> int:
+        # Side to move is mixed in here rather than in make_move, since callers may assign current_player directly
+        return self._hash ^ SIDE_KEY if self.current_player == -1 else self._hash
+
+    def _get_bitboards(self) -> Tuple[int, int, int, int]:
+        """Returns (men, kings, opponents, empty) bitboards from the current player's point of view"""
+        if self.current_player == 1:
+            men, kings = self.black_men, self.black_kings
+            opponents = self.white_men | self.white_kings
+        else:
+            men, kings = self.white_men, self.white_kings
+            opponents = self.black_men | self.black_kings
+        return men, kings, opponents, FULL_MASK & ~(men | kings | opponents)
+
+    def _has_any_move(self) -> bool:
+        """Returns True as soon as any legal move is found, without generating the move list"""
+        cached = self._move_cache.get(self._cache_key())
+        if cached is not None:
+            return bool(cached)
+
+        men, kings, opponents, empty = self._get_bitboards()
+        for pieces, piece in self._get_movers(men, kings):
+            for offset, step_mask in STEPS[piece]:
+                # _shift inlined, here and in _get_normal_moves, to save a call per step rule
+                if offset > 0:
+                    stepped = (pieces & step_mask) << offset
+                else:
+                    stepped = (pieces & step_mask) >> -offset
+                if stepped & empty:
+                    return True
+            if _get_jumpers(pieces, JUMP_RULES[piece], opponents, empty):
+                return True
+        return False
+
+    def _get_movers(self, men: int, kings: int) -> Tuple[Tuple[int, int], ...]:
+        """Returns the (bitboard, piece code) pairs to generate moves for.
+
+        The side to move usually has no kings until late in the game, so the king tables are left out entirely
+        then instead of being looped over for an empty bitboard."""
+        man, king = PLAYER_PIECES[self.current_player]
+        return ((men, man), (kings, king)) if kings else ((men, man),)
+
+    def _generate_moves(self) -> List[Move]:
+        """Generates the valid moves of the current position"""
+        men, kings, opponents, empty = self._get_bitboards()
+        movers = self._get_movers(men, kings)
+
+        if NUMBA_AVAILABLE:
+            capture_moves = self._get_all_capture_moves(men, kings, opponents, empty)
+            return capture_moves if capture_moves else self._get_normal_moves(movers, empty)
+
+        # Jumps are mandatory. Without the kernel, first find the pieces that can jump at all with a few
+        # bitboard shifts, so the Python search only runs from those (and not at all in most positions)
+        jumpers = [(_get_jumpers(pieces, JUMP_RULES[piece], opponents, empty), piece) for pieces, piece in movers]
+        if not any(pieces for pieces, _ in jumpers):
+            return self._get_normal_moves(movers, empty)
+
+        capture_moves = []
+        for pieces, piece in jumpers:
+            for sq in _squares(pieces):
+                capture_moves.extend(self._get_capture_moves(sq, JUMPS[piece], opponents, empty))
+        return capture_moves
+
+    def _get_normal_moves(self, movers: Tuple[Tuple[int, int], ...], empty: int) -> List[Move]:
+        """Returns all non-capture moves of the given (bitboard, piece code) movers, shifting each bitboard once per step offset"""
         moves = []
-        capture_moves = []  # Jumps are mandatory
-
-        for row in range(8):
-            for col in range(8):
-                piece = self.board[row][col]
-                # Check if piece belongs to current player
-                if self._is_current_players_piece(piece):
-                    piece_captures = self._get_capture_moves(
-                        row, col)  # Check for possible captures
-                    if piece_captures:
-                        capture_moves.extend(((row, col), captures)
-                                             for captures in piece_captures)
-                    else:
-                        piece_moves = self._get_normal_moves(row, col)
-                        moves.extend(((row, col), [move])
-                                     for move in piece_moves)
-
-        return capture_moves if capture_moves else moves
-
-    def _is_current_players_piece(self, piece: int) -> bool:
-        if self.current_player == 1:  # Black's turn
-            return piece in [1, 2]  # Black piece or king
-        else:  # White's turn
-            return piece in [3, 4]  # White piece or king
-
-    def _get_normal_moves(self, row: int, col: int) -> List[Tuple[int, int]]:
-        """Finds all pieces belonging to self.current_player and returns list of all possible non-capture moves"""
-        moves = []
-        piece = self.board[row][col]
-
-        directions = []
-        if piece in [1, 2]:  # Black piece or king
-            directions.extend([(1, -1), (1, 1)])
-        if piece in [3, 4]:  # White piece or king
-            directions.extend([(-1, -1), (-1, 1)])
-        if piece in [2, 4]:  # Kings can move backwards
-            directions.extend([(-1, -1), (-1, 1)] if piece ==
-                              2 else [(1, -1), (1, 1)])
-
-        for dr, dc in directions:
-            new_row, new_col = row + dr, col + dc
-            if self._is_valid_position(new_row, new_col) and self.board[new_row][new_col] == 0:
-                moves.append((new_row, new_col))
+        append = moves.append
+        for pieces, piece in movers:
+            for offset, step_mask in STEPS[piece]:
+                if offset > 0:
+                    targets = ((pieces & step_mask) << offset) & empty
+                else:
+                    targets = ((pieces & step_mask) >> -offset) & empty
+                while targets:  # _squares inlined
+                    low_bit = targets & -targets
+                    dst = low_bit.bit_length() - 1
+                    append(((dst - offset, dst), 0))
+                    targets ^= low_bit
 
         return moves
 
-    def _get_capture_moves(self, row: int, col: int) -> List[List[Tuple[int, int]]]:
+    def _get_all_capture_moves(self, men: int, kings: int, opponents: int, empty: int) -> List[Move]:
+        """Runs the compiled capture kernel over every piece at once and unpacks its flat output"""
+        man, king = PLAYER_PIECES[self.current_player]
+        flat = _capture_sequences_kernel(
+            men, kings, opponents, empty, JUMP_ARRAYS[man], JUMP_ARRAYS[king]).tolist()
+        capture_moves = []
+        i = 0
+        while i < len(flat):
+            length = flat[i]
+            capture_moves.append((tuple(flat[i + 2:i + 3 + length]), flat[i + 1]))
+            i += length + 3
+        return capture_moves
+
+    def _get_capture_moves(self, sq: int, jumps: tuple, opponents: int, empty: int) -> List[Move]:
         captures = []
-        self._find_capture_sequences(row, col, [], captures, set())
+        self._find_capture_sequences(
+            sq, jumps, opponents, empty, [sq], captures, 0, 0)
         return captures
 
-    def _find_capture_sequences(self, row: int, col: int, current_sequence: List[Tuple[int, int]],
-                                all_sequences: List[List[Tuple[int, int]]], visited: set) -> None:
-        """Takes in the current position and sequence of jumps and finds all possible capture sequences. Used recursively, directly appends to sequences instead of returning anything."""
-
-        piece = self.board[row][col]
+    def _find_capture_sequences(self, sq: int, jumps: tuple, opponents: int, empty: int,
+                                current_sequence: List[int], all_sequences: List[Move], visited: int, captured: int) -> None:
+        """Takes in the current square and sequence of squares so far (starting square first) and finds all possible capture sequences. Used recursively as a backtracking search: each jump is appended to current_sequence before recursing and popped after, and copies are appended to all_sequences instead of returning anything.
 
-        directions = []
-        if piece in [2, 4]:  # Kings
-            directions.extend([(2, -2), (2, 2), (-2, -2), (-2, 2)])
-        elif piece == 1:  # Black piece
-            # Bottom left, bottom right respectively
-            directions.extend([(2, -2), (2, 2)])
-        elif piece == 3:  # White piece
-            # Top left, top right respectively
-            directions.extend([(-2, -2), (-2, 2)])
+        visited and captured are bitmasks of the landing and jumped squares so far on this branch. The moving piece still occupies its starting square in `empty`, so it can never land back on it."""
 
         found_capture = False
-        for dx, dy in directions:
-            new_row, new_col = row + dx, col + dy  # End position after jump
-            jumped_row, jumped_col = row + dx//2, col + dy//2  # Position jumped over
+        for new_sq, jumped_sq in jumps[sq]:  # End position after jump, position jumped over
 
-            if ((new_row, new_col) not in visited and
-                # Check if new position is on board
-                self._is_valid_position(new_row, new_col) and
+            if (not (visited >> new_sq) & 1 and
                 # Check if new position is empty
-                self.board[new_row][new_col] == 0 and
-                    self._is_opponent_piece(self.board[jumped_row][jumped_col])):  # Check if jumping over opponent's piece
+                (empty >> new_sq) & 1 and
+                    (opponents >> jumped_sq) & 1):  # Check if jumping over opponent's piece
 
                 found_capture = True
-                visited.add((new_row, new_col))
-                new_sequence = current_sequence + \
-                    [(new_row, new_col)]  # Add jump to sequence
+                current_sequence.append(new_sq)  # Add jump to sequence
                 self._find_capture_sequences(
-                    new_row, new_col, new_sequence, all_sequences, visited)
-                visited.remove((new_row, new_col))
-
-        if not found_capture and current_sequence:
-            all_sequences.append(current_sequence)
-
-    def _is_opponent_piece(self, piece: int) -> bool:
-        if self.current_player == 1:  # Black's turn
-            return piece in [3, 4]  # White pieces
-        else:  # White's turn
-            return piece in [1, 2]  # Black pieces
-
-    def _is_valid_position(self, row: int, col: int) -> bool:
-        return 0 <= row < 8 and 0 <= col < 8
-
-    def make_move(self, start_pos: Tuple[int, int], moves: List[Tuple[int, int]]) -> None:
-        """Make a move or sequence of captures"""
-        row, col = start_pos
-        piece = self.board[row][col]
-
-        # Move the piece through the sequence
-        self.board[row][col] = 0
-        for i, (new_row, new_col) in enumerate(moves):
-
-            # CAPTURE
-            if abs(new_row - row) == 2:
-                jumped_row = (new_row + row) // 2
-                jumped_col = (new_col + col) // 2
-                self.board[jumped_row][jumped_col] = 0
-
-            # LAST MOVE
-            if i == len(moves) - 1:  # Final position
-                # Check if piece should be kinged
-                if piece == 1 and new_row == 7:  # Black piece reaches bottom
-                    piece = 2
-                elif piece == 3 and new_row == 0:  # White piece reaches top
-                    piece = 4
-                self.board[new_row][new_col] = piece
-            row, col = new_row, new_col
-
-        self.current_player *= -1  # Switch players
+                    new_sq, jumps, opponents, empty, current_sequence, all_sequences,
+                    visited | (1 << new_sq), captured | (1 << jumped_sq))
+                current_sequence.pop()
+
+        if not found_capture and len(current_sequence) > 1:
+            # current_sequence is shared by every branch, so only finished sequences are copied
+            all_sequences.append((tuple(current_sequence), captured))
+
+    def make_move(self, move: Move) -> None:
+        """Make a move or sequence of captures, as returned by get_valid_moves"""
+        path, captured = move
+        src, dst = path[0], path[-1]
+        src_bit, dst_bit = 1 << src, 1 << dst
+        player = self.current_player
+        zobrist = ZOBRIST
+
+        if player == 1:
+            men, kings = self.black_men, self.black_kings
+            opp_men, opp_kings = self.white_men, self.white_kings
+        else:
+            men, kings = self.white_men, self.white_kings
+            opp_men, opp_kings = self.black_men, self.black_kings
+        man, king = PLAYER_PIECES[player]
+        opp_man, opp_king = PLAYER_PIECES[-player]
+
+        if kings & src_bit:
+            kings ^= src_bit | dst_bit
+            h = self._hash ^ zobrist[king][src] ^ zobrist[king][dst]
+        elif dst_bit & PROMOTION_RANK[player]:  # Check if piece should be kinged
+            men ^= src_bit
+            kings |= dst_bit
+            h = self._hash ^ zobrist[man][src] ^ zobrist[king][dst]
+        else:
+            men ^= src_bit | dst_bit
+            h = self._hash ^ zobrist[man][src] ^ zobrist[man][dst]
+
+        if captured:  # Clear every jumped piece at once
+            h ^= _zobrist_of(opp_men & captured, opp_man) ^ _zobrist_of(opp_kings & captured, opp_king)
+            opp_men &= ~captured
+            opp_kings &= ~captured
+        self._hash = h
+
+        if player == 1:
+            self.black_men, self.black_kings = men, kings
+            self.white_men, self.white_kings = opp_men, opp_kings
+        else:
+            self.white_men, self.white_kings = men, kings
+            self.black_men, self.black_kings = opp_men, opp_kings
+
+        self.current_player = -player  # Switch players
 
     def is_game_over(self) -> bool:
-        return len(self.get_valid_moves()) == 0
+        return not self._has_any_move()
 
     def get_winner(self) -> Optional[int]:
         if not self.is_game_over():
@@ -188,14 +527,24 @@ class CheckersGame:
         return -self.current_player  # Previous player won
 
     def get_state(self) -> np.ndarray:
-        return self.board.deepcopy()
+        return self.board
+
+    def clone(self) -> 'CheckersGame':
+        """Returns an independent copy of the game, copying only the bitboards and scalars"""
+        game = CheckersGame.__new__(CheckersGame)
+        game.black_men, game.black_kings = self.black_men, self.black_kings
+        game.white_men, game.white_kings = self.white_men, self.white_kings
+        game.current_player = self.current_player
+        game._hash = self._hash
+        return game
 
     def __str__(self) -> str:
         symbols = {0: ".", 1: "b", 2: "B", 3: "w", 4: "W"}
+        board = self.board
         board_str = "  0 1 2 3 4 5 6 7\n"
         for i in range(8):
             board_str += f"{i} "
             for j in range(8):
-                board_str += symbols[self.board[i][j]] + " "
+                board_str += symbols[board[i][j]] + " "
             board_str += "\n"
         return board_str
@@ -1,12 +1,13 @@
-from game import CheckersGame
+from game import CheckersGame, Move, decode_move
 from mcts import MCTS
 
 
-def get_human_move(game: CheckersGame) -> tuple:
+def get_human_move(game: CheckersGame) -> Move:
     """Get a move from human player"""
     print("\nValid moves:")
     valid_moves = game.get_valid_moves()
-    for i, (start, moves) in enumerate(valid_moves):
+    for i, move in enumerate(valid_moves):
+        start, moves = decode_move(move)
         print(f"{i}: {start} -> {moves}")
 
     while True:
@@ -33,18 +34,20 @@ def main():
 
         if not self_play:
             if game.current_player == 1:  # Human plays as black
-                start_pos, moves = get_human_move(game)
+                move = get_human_move(game)
             else:  # AI plays as white
                 print("AI is thinking...")
-                start_pos, moves = mcts.get_best_move(iterations=1000)
+                move = mcts.get_best_move(iterations=1000)
+                start_pos, moves = decode_move(move)
                 print(f"AI move: {start_pos} -> {moves}")
         else:
             # Both players are AI
             print("AI is thinking...")
-            start_pos, moves = mcts.get_best_move(iterations=1000)
+            move = mcts.get_best_move(iterations=1000)
+            start_pos, moves = decode_move(move)
             print(f"AI move: {start_pos} -> {moves}")
 
-        game.make_move(start_pos, moves)
+        game.make_move(move)
 
     # Game over
     winner = game.get_winner()
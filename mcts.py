@@ -2,7 +2,7 @@ from typing import Tuple, List, Optional, Union
 import numpy as np
 import random
 from copy import deepcopy
-from game import CheckersGame
+from game import CheckersGame, Move
 from node import Node
 
 
@@ -49,7 +49,7 @@ class MCTS:
 
         return selected_child
 
-    def _expand(self, node: Node) -> Union[Node, NoneType]:
+    def _expand(self, node: Node) -> Optional[Node]:
         """
         Takes in a leaf node and adds a new child node with a random valid move.
 
@@ -71,18 +71,18 @@ class MCTS:
             return None
 
         # Choose a random move to expand
-        start_pos, moves = random.choice(valid_moves)
+        move = random.choice(valid_moves)
 
         # Create a new game state by applying the move
-        new_game = deepcopy(temp_game)
-        new_game.make_move(start_pos, moves)
+        new_game = temp_game.clone()
+        new_game.make_move(move)
 
         # Create a new child node
         child = Node(parent=node)
         child.state = new_game.board
         child.player = new_game.current_player
         # Store the move that led to this state
-        child.move = (start_pos, moves)
+        child.move = move
 
         # Add the child to the parent's children
         node.children.append(child)
@@ -115,8 +115,7 @@ class MCTS:
                 break
 
             # Choose a random move
-            start_pos, moves = random.choice(valid_moves)
-            temp_game.make_move(start_pos, moves)
+            temp_game.make_move(random.choice(valid_moves))
 
         # Determine the result
         winner = temp_game.get_winner()
@@ -143,7 +142,7 @@ class MCTS:
             result = 1.0 - result
             current = current.parent
 
-    def get_best_move(self, iterations: int = 1000) -> Tuple[Tuple[int, int], List[Tuple[int, int]]]:
+    def get_best_move(self, iterations: int = 1000) -> Move:
         """
         Runs the MCTS algorithm for a specified number of iterations and returns the best move.
 
@@ -151,7 +150,7 @@ class MCTS:
             - iterations: Number of MCTS iterations to run
 
         Returns:
-            - The best move as (start_pos, moves)
+            - The best move, encoded as (path, captured) (see game.decode_move)
         """
         # Create root node with current game state
         root = Node()
@@ -10,7 +10,7 @@ class Node:
         self.visits = 0        # Number of times this node has been visited
         self.value = 0.0       # Total value of this state
         self.player = None     # Player at this node (1 for black, -1 for white)
-        self.move = None       # Move that led to this state (start_pos, moves)
+        self.move = None       # Move that led to this state (path, captured)
         # self.prior = prior  # Added prior probability from policy network
 
     def calculate_ucb_score(self, exploration_arg: float) -> float: